@@ -3,9 +3,57 @@
 営業リストデータをクレンジングする
 """
 
+import numpy as np
 import pandas as pd
 import re
 
+# Copy-on-Writeを有効化する（pandas 3.0以降は常に有効）
+# シャローコピーでもカラム代入が呼び出し元のフレームへ波及しなくなり、
+# クレンジング時のピークメモリを抑えられる
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.options.mode.copy_on_write = True
+
+# Numbaが利用可能なら、大規模データ向けの郵便番号抽出をJITコンパイルする
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+    prange = range
+
+# 郵便番号のNumba高速パスを使う最小行数
+# （小規模データではJITコンパイルのオーバーヘッドの方が大きい）
+_NUMBA_MIN_ROWS = 100_000
+
+# 全角数字を半角に揃える変換テーブル
+# （pandasパスとNumbaパスの結果がデータ量に依存しないよう、両方で使う）
+_FULLWIDTH_DIGITS = str.maketrans('０１２３４５６７８９', '0123456789')
+
+
+def _extract_postal_digits(buf, offsets, out, valid):
+    """
+    連結バイト列から行ごとに数字を抽出する（Numba JIT対象カーネル）
+
+    Args:
+        buf: 全行を連結したASCIIバイト列（uint8配列）
+        offsets: 各行の開始オフセット（長さ N+1 のint64配列）
+        out: 抽出した数字の出力先（(N, 7) のuint8配列）
+        valid: 数字がちょうど7桁だった行のフラグ（長さNのbool配列）
+    """
+    for i in prange(len(offsets) - 1):
+        count = 0
+        for j in range(offsets[i], offsets[i + 1]):
+            ch = buf[j]
+            if 48 <= ch <= 57:  # '0'-'9'
+                if count < 7:
+                    out[i, count] = ch
+                count += 1
+        valid[i] = count == 7
+
+
+if _HAS_NUMBA:
+    _extract_postal_digits = njit(parallel=True, cache=True)(_extract_postal_digits)
+
 
 class DataCleaner:
     """
@@ -19,7 +67,9 @@ class DataCleaner:
         Args:
             df (pd.DataFrame): 生データのデータフレーム
         """
-        self.df = df.copy()
+        # Copy-on-Writeにより、シャローコピーでも元のフレームは変更されない
+        # （変更したカラムのデータだけが遅延コピーされる）
+        self.df = df.copy(deep=False)
         self.errors = []  # エラーリスト
 
     def clean(self) -> pd.DataFrame:
@@ -48,91 +98,153 @@ class DataCleaner:
 
     def _normalize_postal_code(self):
         """郵便番号を XXX-XXXX 形式に正規化"""
-        def format_postal_code(code):
-            # NaNや空文字列の場合はNoneを返す
-            if pd.isna(code) or str(code).strip() == '' or str(code).lower() == 'nan':
-                return None
-
-            # 数字のみを抽出
-            digits = re.sub(r'\D', '', str(code))
-
-            # 7桁でない場合はNaNを返す
-            if len(digits) != 7:
-                return None
-
-            # XXX-XXXX形式に変換
-            return f"{digits[:3]}-{digits[3:]}"
-
-        self.df['郵便番号'] = self.df['郵便番号'].apply(format_postal_code)
+        if _HAS_NUMBA and len(self.df) >= _NUMBA_MIN_ROWS:
+            # 大規模データではJITコンパイルした数字抽出カーネルを使う
+            self.df['郵便番号'] = self._normalize_postal_code_numba(
+                self.df['郵便番号']
+            )
+        else:
+            if len(self.df) >= _NUMBA_MIN_ROWS:
+                print("⚠ 警告: numbaがインストールされていないため、"
+                      "郵便番号の正規化をpandasで処理します")
+
+            # pandasのベクトル化str演算で一括処理する
+            # 全角数字は半角に揃えてから抽出する（Numbaパスと同じ結果になる）
+            # （'nan'などの文字列はすべて非数字として除去される）
+            digits = (
+                self.df['郵便番号']
+                .astype('string')
+                .str.translate(_FULLWIDTH_DIGITS)
+                .str.replace(r'\D', '', regex=True)
+            )
+
+            # 7桁の数字が揃っている場合のみ XXX-XXXX 形式に変換、それ以外は欠損
+            valid = digits.str.len() == 7
+            self.df['郵便番号'] = (
+                digits.str.slice(0, 3) + '-' + digits.str.slice(3, 7)
+            ).where(valid, other=pd.NA)
 
         # 郵便番号欠損の件数をカウント
         missing_count = self.df['郵便番号'].isna().sum()
         if missing_count > 0:
             self.errors.append(f"郵便番号欠損: {missing_count}件")
 
-    def _normalize_address(self):
-        """住所を標準化"""
-        def clean_address(row):
-            address = str(row['住所（標準化）'])
-            prefecture = str(row['都道府県'])
-
-            # NaNの場合は空文字列を返す
-            if address == 'nan':
-                return ''
+    @staticmethod
+    def _normalize_postal_code_numba(codes: pd.Series) -> pd.Series:
+        """
+        Numbaカーネルで郵便番号を正規化する（大規模データ向け）
 
-            # 都道府県名の重複を削除
-            # 例: 「神奈川県神奈川県横浜市」→「神奈川県横浜市」
-            if prefecture != 'nan' and address.count(prefecture) > 1:
-                address = address.replace(prefecture, '', 1)
+        全行をASCIIバイト列に連結し、JITコンパイルしたカーネルで
+        数字抽出を行ごとに並列実行する。
 
-            # 全角スペースを半角に統一
-            address = address.replace('　', ' ')
+        Args:
+            codes (pd.Series): 生の郵便番号カラム
 
-            return address
+        Returns:
+            pd.Series: XXX-XXXX 形式に正規化した郵便番号（不正な値はpd.NA）
+        """
+        # 全角数字を半角に揃えてからASCII化する（pandasパスと同じ結果になる）
+        # 残りの非ASCII文字は数字ではないため落としてよい
+        encoded = [
+            s.translate(_FULLWIDTH_DIGITS).encode('ascii', 'ignore')
+            for s in codes.astype('string').fillna('').tolist()
+        ]
+        lengths = np.fromiter(
+            (len(b) for b in encoded), dtype=np.int64, count=len(encoded)
+        )
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        buf = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+
+        out = np.zeros((len(encoded), 7), dtype=np.uint8)
+        valid = np.zeros(len(encoded), dtype=np.bool_)
+        _extract_postal_digits(buf, offsets, out, valid)
+
+        # 抽出した7桁をハイフン付き文字列へ一括変換
+        digits = pd.Series(
+            out.view('S7').ravel().astype('U7'),
+            index=codes.index, dtype='string'
+        )
+        return (
+            digits.str.slice(0, 3) + '-' + digits.str.slice(3, 7)
+        ).where(pd.Series(valid, index=codes.index), other=pd.NA)
 
-        self.df['住所_整形済み'] = self.df.apply(clean_address, axis=1)
+    def _normalize_address(self):
+        """住所を標準化"""
+        # axis=1のapplyは行ごとにSeriesを生成して最も遅いため、
+        # 都道府県ごとにグループ化してカラム単位のベクトル演算で処理する
+        addresses = self.df['住所（標準化）'].astype('string').fillna('')
+        prefectures = self.df['都道府県'].astype('string').fillna('')
+
+        # 都道府県名の重複を削除
+        # 例: 「神奈川県神奈川県横浜市」→「神奈川県横浜市」
+        for prefecture in prefectures[prefectures != ''].unique():
+            selected = prefectures == prefecture
+            duplicated = addresses[selected].str.count(re.escape(prefecture)) > 1
+            if duplicated.any():
+                target = selected & duplicated.reindex(addresses.index, fill_value=False)
+                addresses[target] = addresses[target].str.replace(
+                    prefecture, '', n=1, regex=False
+                )
+
+        # 全角スペースを半角に統一
+        self.df['住所_整形済み'] = addresses.str.replace('　', ' ', regex=False)
 
     def _format_name(self):
         """氏名に「様」を付与"""
-        def format_name(name):
-            name = str(name).strip()
-
-            # NaNの場合は空文字列を返す
-            if name == 'nan':
-                return ''
+        # 行ごとのapplyではなく、pandasのベクトル化str演算で一括処理する
+        names = self.df['氏名'].astype('string').fillna('').str.strip()
 
-            # 既に「様」が付いている場合はそのまま
-            if name.endswith('様'):
-                return name
+        # スペースを削除して「様」を付与（既に付いている場合はそのまま）
+        formatted = (
+            names.str.replace(' ', '', regex=False)
+            .str.replace('　', '', regex=False)
+            + ' 様'
+        )
+        formatted = formatted.where(~names.str.endswith('様'), names)
 
-            # 全角スペースを削除
-            name = name.replace(' ', '').replace('　', '')
-
-            # 「様」を付与
-            return f"{name} 様"
-
-        self.df['氏名_整形済み'] = self.df['氏名'].apply(format_name)
+        # 氏名が欠損している場合は空文字列
+        self.df['氏名_整形済み'] = formatted.where(names != '', '')
 
     def _detect_foreign_address(self):
         """国外住所を検出"""
-        def is_foreign(address):
-            # NaNや空文字列の場合はFalse
-            if pd.isna(address) or str(address).strip() == '':
-                return False
-
-            address = str(address)
-
-            # ローマ字（A-Z, a-z）の割合を計算
-            alphabet_count = len(re.findall(r'[A-Za-z]', address))
-            total_count = len(address)
-
-            if total_count == 0:
-                return False
+        # 正規表現の状態機械を通さず、全住所を連結したコードポイント配列への
+        # 1回のNumPy比較でローマ字数をカウントする
+        addresses = self.df['住所_整形済み'].astype('string').fillna('')
+        lengths = addresses.str.len().to_numpy(dtype=np.int64)
+
+        if lengths.sum() == 0:
+            self.df['国外住所フラグ'] = np.zeros(len(lengths), dtype=bool)
+        else:
+            # 連結バッファをUTF-32として読むと、1文字 = 1コードポイントになる
+            codepoints = np.frombuffer(
+                ''.join(addresses.tolist()).encode('utf-32-le'), dtype=np.uint32
+            )
+            is_alphabet = (
+                ((codepoints >= 65) & (codepoints <= 90))     # A-Z
+                | ((codepoints >= 97) & (codepoints <= 122))  # a-z
+            )
+
+            # 行ごとの開始オフセットで区切ってローマ字数を集計
+            # 末尾が空文字列の行だと開始オフセットがバッファ長に一致して
+            # reduceatに渡せないため、バッファ内に開始位置を持つ行だけを
+            # 集計し、末尾の空行はゼロのまま残す
+            offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+            np.cumsum(lengths, out=offsets[1:])
+            starts = offsets[:-1]
+            inside = starts < len(codepoints)
+            alphabet_counts = np.zeros(len(lengths), dtype=np.int64)
+            alphabet_counts[inside] = np.add.reduceat(
+                is_alphabet.astype(np.int64), starts[inside]
+            )
+
+            # 途中の空文字列の行はreduceatが隣の値を拾うためゼロで上書きする
+            alphabet_counts[lengths == 0] = 0
 
             # ローマ字が50%以上なら国外と判定
-            return (alphabet_count / total_count) > 0.5
-
-        self.df['国外住所フラグ'] = self.df['住所_整形済み'].apply(is_foreign)
+            self.df['国外住所フラグ'] = (
+                alphabet_counts / np.maximum(lengths, 1) > 0.5
+            )
 
         # 国外住所の件数をカウント
         foreign_count = self.df['国外住所フラグ'].sum()
@@ -141,17 +253,12 @@ class DataCleaner:
 
     def _detect_duplicate_address(self):
         """重複住所を検出"""
-        # 空の住所は除外してカウント
-        non_empty_df = self.df[self.df['住所_整形済み'] != '']
-
-        # 住所ごとに件数をカウント
-        address_counts = non_empty_df.groupby('住所_整形済み').size()
-
-        # 重複している住所（2件以上）を抽出
-        duplicate_addresses = address_counts[address_counts > 1].index.tolist()
-
-        # 重複フラグを付与
-        self.df['重複住所フラグ'] = self.df['住所_整形済み'].isin(duplicate_addresses)
+        # duplicated(keep=False)はハッシュテーブル1パスで2件以上の住所を
+        # すべてマークする（groupby + isinの2パスと同じ結果）
+        addresses = self.df['住所_整形済み']
+        self.df['重複住所フラグ'] = (
+            (addresses != '') & addresses.duplicated(keep=False)
+        )
 
         # 重複住所の件数をカウント
         duplicate_count = self.df['重複住所フラグ'].sum()
@@ -161,3 +268,33 @@ class DataCleaner:
     def get_errors(self) -> list:
         """エラーリストを取得"""
         return self.errors
+
+    @staticmethod
+    def collect_errors(df: pd.DataFrame) -> list:
+        """
+        クレンジング済みデータフレームからエラーリストを再構築する
+
+        Parquetキャッシュから読み込んだ場合など、clean()を経由せずに
+        クレンジング済みデータを得たときに使う。
+
+        Args:
+            df (pd.DataFrame): クレンジング済みデータフレーム
+
+        Returns:
+            list: エラーリスト（clean()が生成するものと同じ形式）
+        """
+        errors = []
+
+        missing_count = df['郵便番号'].isna().sum()
+        if missing_count > 0:
+            errors.append(f"郵便番号欠損: {missing_count}件")
+
+        foreign_count = df['国外住所フラグ'].sum()
+        if foreign_count > 0:
+            errors.append(f"国外住所検出: {foreign_count}件")
+
+        duplicate_count = df['重複住所フラグ'].sum()
+        if duplicate_count > 0:
+            errors.append(f"重複住所検出: {duplicate_count}件")
+
+        return errors
@@ -12,6 +12,18 @@ class DataLoader:
     Excelファイルから営業リストを読み込むクラス
     """
 
+    # 必須カラム（これ以外のカラムは読み込まない）
+    REQUIRED_COLUMNS = ['優先順位', '氏名', '郵便番号', '住所（標準化）', '都道府県']
+
+    # カラムごとのdtype指定（pandasの型推論スキャンを省略する）
+    _COLUMN_DTYPES = {
+        '優先順位': 'Int32',
+        '氏名': 'string',
+        '郵便番号': 'string',
+        '住所（標準化）': 'string',
+        '都道府県': 'string',
+    }
+
     def __init__(self, file_path: str):
         """
         コンストラクタ
@@ -37,19 +49,91 @@ class DataLoader:
             raise FileNotFoundError(f"ファイルが見つかりません: {self.file_path}")
 
         # Excelファイルを読み込み（シート「営業リスト」を指定）
+        # calamineエンジン（Rust実装）が利用可能なら優先する
+        # （openpyxlのデフォルトモードより大きなファイルで大幅に高速）
         try:
-            df = pd.read_excel(self.file_path, sheet_name='営業リスト')
+            df = self._read_sheet()
         except ValueError as e:
             raise ValueError(f"シート「営業リスト」が見つかりません: {e}")
 
         # 必須カラムの確認
-        required_columns = ['優先順位', '氏名', '郵便番号', '住所（標準化）', '都道府県']
-        missing_columns = [col for col in required_columns if col not in df.columns]
+        missing_columns = [col for col in self.REQUIRED_COLUMNS
+                           if col not in df.columns]
 
         if missing_columns:
             raise ValueError(f"必須カラムが存在しません: {missing_columns}")
 
-        # 郵便番号を文字列型に変換（数値型で読み込まれる場合があるため）
-        df['郵便番号'] = df['郵便番号'].astype(str)
-
         return df
+
+    def _read_sheet(self) -> pd.DataFrame:
+        """
+        シート「営業リスト」を読み込む
+
+        Returns:
+            pd.DataFrame: 読み込んだデータフレーム
+        """
+        try:
+            # Rust実装のcalamineエンジン（python-calamineが必要）
+            # usecols/dtypeを指定して不要カラムの構築と型推論を省略する
+            # （usecolsはcallableにして、欠損カラムの検出はload()側に任せる）
+            return pd.read_excel(self.file_path, sheet_name='営業リスト',
+                                 engine='calamine',
+                                 usecols=lambda col: col in self.REQUIRED_COLUMNS,
+                                 dtype=self._COLUMN_DTYPES)
+        except ImportError:
+            # calamineが利用できない環境ではopenpyxlのストリーミング読み込みへ
+            return self._read_sheet_streaming()
+        except ValueError as e:
+            # pandas 2.2未満はcalamineエンジン自体を認識しない
+            # （シート欠損などのValueErrorはそのまま呼び出し元へ伝える）
+            if 'Unknown engine' in str(e):
+                return self._read_sheet_streaming()
+            raise
+
+    def _read_sheet_streaming(self) -> pd.DataFrame:
+        """
+        openpyxlのread_onlyモードでシートをストリーミング読み込みする
+
+        デフォルトモードはCellオブジェクトとスタイル情報を全セル分構築する
+        ため、値のみを走査して辞書（カラム名 → 値リスト）からDataFrameを
+        直接組み立てる。大きなワークブックでメモリ・時間とも大幅に削減できる。
+
+        Returns:
+            pd.DataFrame: 読み込んだデータフレーム
+
+        Raises:
+            ValueError: シート「営業リスト」が存在しない場合
+        """
+        import openpyxl
+
+        wb = openpyxl.load_workbook(self.file_path, read_only=True,
+                                    data_only=True)
+        try:
+            if '営業リスト' not in wb.sheetnames:
+                raise ValueError("Worksheet 営業リスト does not exist.")
+
+            rows = wb['営業リスト'].iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return pd.DataFrame()
+
+            # 必須カラムのみを収集する（不要カラムはリスト化すらしない）
+            keep = [i for i, name in enumerate(header)
+                    if name in self.REQUIRED_COLUMNS]
+            columns = {header[i]: [] for i in keep}
+            value_lists = list(columns.values())
+            for row in rows:
+                # 末尾セルが省略された行はNoneで埋めて桁をそろえる
+                if len(row) < len(header):
+                    row = row + (None,) * (len(header) - len(row))
+                for values, i in zip(value_lists, keep):
+                    values.append(row[i])
+
+            # 欠損を含む数値カラムがfloat化して '1234567.0' のような文字列に
+            # ならないよう、object型のまま組み立ててからdtypeを適用する
+            df = pd.DataFrame(columns, dtype=object)
+            return df.astype({col: dtype
+                              for col, dtype in self._COLUMN_DTYPES.items()
+                              if col in df.columns})
+        finally:
+            wb.close()
@@ -3,157 +3,488 @@ PDF生成モジュール
 宛名ラベルPDFを生成する
 """
 
+from concurrent.futures import ProcessPoolExecutor
+import io
+import os
+import tempfile
+
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+import numpy as np
 import pandas as pd
 
+# Numbaが利用可能なら、大規模データ向けの住所分割をJITコンパイルする
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+    prange = range
+
+# 住所分割のNumba高速パスを使う最小行数
+# （小規模データではJITコンパイルのオーバーヘッドの方が大きい）
+_NUMBA_MIN_ROWS = 100_000
+
+
+def _fill_address_line_breaks(offsets, line_offsets, max_length,
+                              line_starts, line_ends):
+    """
+    行ごとの住所分割位置を計算する（Numba JIT対象カーネル）
+
+    Args:
+        offsets: 連結文字列内での各住所の開始位置（長さ N+1 のint64配列）
+        line_offsets: 出力配列内での各住所の行開始位置（長さ N+1 のint64配列）
+        max_length: 1行の最大文字数
+        line_starts: 各行のスライス開始位置の出力先（int64配列）
+        line_ends: 各行のスライス終了位置の出力先（int64配列）
+    """
+    for i in prange(len(offsets) - 1):
+        start = offsets[i]
+        end = offsets[i + 1]
+        out = line_offsets[i]
+        for k in range(line_offsets[i + 1] - out):
+            line_start = start + k * max_length
+            line_end = line_start + max_length
+            if line_end > end:
+                line_end = end
+            line_starts[out + k] = line_start
+            line_ends[out + k] = line_end
+
+
+if _HAS_NUMBA:
+    _fill_address_line_breaks = njit(parallel=True, cache=True)(
+        _fill_address_line_breaks
+    )
+
+
+# 10面レイアウトの設定（A4を2列×5行に分割）
+# レイアウトはA4サイズのみに依存するため、モジュール読み込み時に一度だけ計算する
+# （クラス本体の内包表記からはクラス属性を参照できないため、モジュール定数に
+#   置いて_POSITIONS/_LABEL_GEOMETRYの導出元とする）
+_LABEL_WIDTH = A4[0] / 2
+_LABEL_HEIGHT = A4[1] / 5
+
+
+def _render_chunk(records: list, output_path: str) -> int:
+    """
+    ワーカープロセス用: レコードのチャンクを1つのPDFに描画する
+
+    Args:
+        records (list): 行データのリスト（dict形式、pickle転送用）
+        output_path (str): チャンクPDFの出力先パス
+
+    Returns:
+        int: 生成したラベル枚数
+    """
+    df = pd.DataFrame(records)
+    generator = PDFGenerator(df, output_path)
+    pdf = canvas.Canvas(output_path, pagesize=A4, pageCompression=1)
+    count = generator._render(pdf)
+    pdf.save()
+    return count
+
 
 class PDFGenerator:
     """
     宛名ラベルPDFを生成するクラス
     """
 
-    def __init__(self, df: pd.DataFrame, output_path: str):
+    # 全ラベル共通の郵便番号プレフィックスと、その事前描画Form名
+    _POSTAL_PREFIX = '〒 '
+    _POSTAL_PREFIX_FORM = 'postal_prefix_grid'
+
+    # 進捗表示の間隔（ページ単位 = 50ページ / 500枚ごと）
+    _PROGRESS_PAGE_INTERVAL = 50
+
+    # 解決済みの日本語フォント名（プロセス内で1回だけ探索するためのキャッシュ）
+    _resolved_font_name = None
+
+    # 日本語フォントの候補（種別, 登録名, 表示名, TTFファイルパス）
+    # 上から順に試し、最初に登録できたものを使う
+    _FONT_CANDIDATES = (
+        # ビルトインのCIDフォント
+        ('cid', 'HeiseiMin-W3', 'HeiseiMin-W3', None),
+        ('cid', 'HeiseiKakuGo-W5', 'HeiseiKakuGo-W5', None),
+        # Mac環境: ヒラギノ明朝
+        ('ttf', 'HiraginoMincho', 'ヒラギノ明朝',
+         '/System/Library/Fonts/ヒラギノ明朝 ProN W3.ttc'),
+        # Linux環境: IPAexMincho
+        ('ttf', 'IPAexMincho', 'IPAexMincho',
+         '/usr/share/fonts/truetype/fonts-japanese-mincho.ttf'),
+    )
+
+    # 配置位置の定義（左列5個、右列5個）
+    # モジュール定数のラベル寸法から一度だけ計算した静的タプルを
+    # 全インスタンスで共有する
+    _POSITIONS = tuple(
+        [(0, A4[1] - _LABEL_HEIGHT * (i + 1)) for i in range(5)]
+        + [(_LABEL_WIDTH, A4[1] - _LABEL_HEIGHT * (i + 1)) for i in range(5)]
+    )
+
+    # 各面の描画座標（テキストx、郵便番号y、住所1行目y、氏名の下限y）
+    # ラベルごとの座標加算はすべて定数なので、ここで一度だけ計算しておく
+    _LABEL_GEOMETRY = tuple(
+        (x + 10, y + _LABEL_HEIGHT - 30, y + _LABEL_HEIGHT - 50, y + 10)
+        for x, y in _POSITIONS
+    )
+
+    def __init__(self, df: pd.DataFrame, output_path):
         """
         コンストラクタ
 
         Args:
             df (pd.DataFrame): クレンジング済みデータフレーム
-            output_path (str): 出力PDFファイルパス
+            output_path (str or file-like): 出力PDFファイルパス、または
+                書き込み可能なバイナリファイルオブジェクト
+                （パイプやBytesIO等にも一時ファイルなしで出力できる）
         """
-        self.df = df
+        # pyarrowが利用可能なら、文字列カラムをArrowバックエンドのdtypeに
+        # 変換しておく（有効判定マスクや空文字比較などの文字列演算が
+        # object dtypeのPython要素ディスパッチではなくC++カーネルで走る）
+        string_columns = [
+            col for col in ('住所_整形済み', '氏名_整形済み')
+            if col in df.columns
+        ]
+        try:
+            self.df = df.astype({col: 'string[pyarrow]' for col in string_columns})
+        except ImportError:
+            self.df = df
         self.output_path = output_path
 
         # 日本語フォントを登録
-        self._register_font()
+        self.font_name = self._register_font()
 
-    def _register_font(self):
-        """日本語フォントを登録"""
-        try:
-            # まず、ビルトインのCIDフォント（HeiseiMin-W3）を試す
-            pdfmetrics.registerFont(UnicodeCIDFont('HeiseiMin-W3'))
-            self.font_name = 'HeiseiMin-W3'
-            print("✓ 日本語フォント（HeiseiMin-W3）を登録しました")
-        except:
-            try:
-                # 次に、HeiseiKakuGo-W5を試す
-                pdfmetrics.registerFont(UnicodeCIDFont('HeiseiKakuGo-W5'))
-                self.font_name = 'HeiseiKakuGo-W5'
-                print("✓ 日本語フォント（HeiseiKakuGo-W5）を登録しました")
-            except:
-                try:
-                    # Mac環境: ヒラギノ明朝を登録
-                    pdfmetrics.registerFont(
-                        TTFont('HiraginoMincho', '/System/Library/Fonts/ヒラギノ明朝 ProN W3.ttc')
-                    )
-                    self.font_name = 'HiraginoMincho'
-                    print("✓ 日本語フォント（ヒラギノ明朝）を登録しました")
-                except:
-                    try:
-                        # Linux環境: IPAexMinchoを使用
-                        pdfmetrics.registerFont(
-                            TTFont('IPAexMincho', '/usr/share/fonts/truetype/fonts-japanese-mincho.ttf')
-                        )
-                        self.font_name = 'IPAexMincho'
-                        print("✓ 日本語フォント（IPAexMincho）を登録しました")
-                    except:
-                        print("⚠ 警告: 専用の日本語フォントが見つかりません。Courier（デフォルト）を使用します。")
-                        print("  日本語が正しく表示されない可能性があります。")
-                        self.font_name = 'Courier'
-
-    def generate(self):
-        """PDFを生成"""
-        # A4サイズのキャンバスを作成
-        pdf = canvas.Canvas(self.output_path, pagesize=A4)
-        width, height = A4
-
-        # 10面レイアウトの設定
-        # A4を2列×5行に分割
-        label_width = width / 2
-        label_height = height / 5
-
-        # 配置位置の定義（左列5個、右列5個）
-        positions = []
-        for i in range(5):
-            # 左列
-            positions.append((0, height - label_height * (i + 1)))
-        for i in range(5):
-            # 右列
-            positions.append((label_width, height - label_height * (i + 1)))
-
-        # 宛名データを10枚ずつ処理
-        page_count = 0
-        total_generated = 0
+    def _register_font(self) -> str:
+        """
+        日本語フォントを登録する
+
+        登録はreportlabのグローバルなフォントレジストリに対する操作のため、
+        プロセス内で複数のPDFを生成する場合に備えて解決結果をクラス変数に
+        キャッシュし、2回目以降の探索をスキップする。
+
+        Returns:
+            str: 登録できたフォント名（見つからない場合は 'Courier'）
+        """
+        if PDFGenerator._resolved_font_name is not None:
+            return PDFGenerator._resolved_font_name
+
+        PDFGenerator._resolved_font_name = self._resolve_font()
+        return PDFGenerator._resolved_font_name
 
-        for index, row in self.df.iterrows():
-            # 郵便番号、住所が欠損している場合はスキップ
-            if pd.isna(row['郵便番号']) or row['住所_整形済み'] == '':
+    def _resolve_font(self) -> str:
+        """
+        利用可能な日本語フォントを探して登録する
+
+        候補は_FONT_CANDIDATESの順に試す。TTFファイルは存在確認してから
+        登録するため、存在しないパスで例外機構を通ることはない。
+
+        Returns:
+            str: 登録できたフォント名（見つからない場合は 'Courier'）
+        """
+        for kind, font_name, label, font_path in self._FONT_CANDIDATES:
+            if font_path is not None and not os.path.exists(font_path):
                 continue
 
-            # 国外住所はスキップ
-            if row['国外住所フラグ']:
+            try:
+                if kind == 'cid':
+                    pdfmetrics.registerFont(UnicodeCIDFont(font_name))
+                else:
+                    pdfmetrics.registerFont(TTFont(font_name, font_path))
+            except Exception:
                 continue
 
-            # 配置位置を取得
-            position_index = page_count % 10
-            x, y = positions[position_index]
+            print(f"✓ 日本語フォント（{label}）を登録しました")
+            return font_name
+
+        print("⚠ 警告: 専用の日本語フォントが見つかりません。Courier（デフォルト）を使用します。")
+        print("  日本語が正しく表示されない可能性があります。")
+        return 'Courier'
+
+    def generate(self, n_workers: int = None) -> int:
+        """
+        PDFを生成
+
+        Args:
+            n_workers (int): 並列ワーカー数（Noneまたは1の場合は逐次処理）
+
+        Returns:
+            int: 生成したラベル枚数
+        """
+        if n_workers and n_workers > 1:
+            try:
+                return self._generate_parallel(n_workers)
+            except ImportError:
+                print("⚠ 警告: pypdfがインストールされていないため、逐次処理で生成します")
+
+        # A4サイズのキャンバスを作成
+        # テキスト中心のコンテンツストリームはFlateDecodeでよく縮むため、
+        # ページ圧縮を有効にして出力サイズとsave()のI/Oを抑える
+        # 出力はメモリ上に組み立ててから1回の書き込みでディスクへ流す
+        # （showPageごとの細かいファイル書き込みをまとめる）
+        buf = io.BytesIO()
+        pdf = canvas.Canvas(buf, pagesize=A4, pageCompression=1)
+        total_generated = self._render(pdf)
+        pdf.save()
+        if hasattr(self.output_path, 'write'):
+            # 開いたままのファイルオブジェクト（パイプやBytesIO等）に直接書き込む
+            self.output_path.write(buf.getbuffer())
+            print("✅ PDFを生成しました")
+        else:
+            with open(self.output_path, 'wb', buffering=1 << 20) as f:
+                f.write(buf.getbuffer())
+            print(f"✅ PDFを生成しました: {self.output_path}")
+        print(f"   生成枚数: {total_generated}枚")
+        return total_generated
+
+    def _generate_parallel(self, n_workers: int) -> int:
+        """
+        データをチャンク分割し、ワーカープロセスで並列にPDFを生成する
 
-            # 宛名を描画
-            self._draw_label(pdf, x, y, row, label_width, label_height)
+        各ワーカーがチャンクを一時PDFに描画し、最後にpypdfで結合する。
 
-            # ページカウントを増やす
-            page_count += 1
+        Args:
+            n_workers (int): 並列ワーカー数
+
+        Returns:
+            int: 生成したラベル枚数
+        """
+        from pypdf import PdfWriter
+
+        n_workers = min(n_workers, os.cpu_count() or 1)
+
+        # 生の行をそのまま分割するとチャンクごとに端数ページが生じ、
+        # 結合後のPDFの途中に空き面のあるページが混ざってしまう
+        # （逐次処理とラベルの割付もずれる）。有効行だけを10枚=1ページ
+        # 単位の境界で分割し、端数は最後のチャンクにだけ残す
+        valid = self.df.loc[self._valid_mask()]
+        n_pages = -(-len(valid) // 10)
+        chunks = [
+            valid.iloc[pages[0] * 10:min((pages[-1] + 1) * 10, len(valid))]
+            for pages in np.array_split(np.arange(n_pages), n_workers)
+            if len(pages) > 0
+        ]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            chunk_paths = []
+            futures = []
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                for i, chunk in enumerate(chunks):
+                    chunk_path = os.path.join(tmp_dir, f"chunk_{i}.pdf")
+                    chunk_paths.append(chunk_path)
+                    # pandas Seriesのpickle転送を避けるため、plainなdictに変換して渡す
+                    futures.append(
+                        executor.submit(_render_chunk, chunk.to_dict('records'), chunk_path)
+                    )
+                counts = [f.result() for f in futures]
+
+            # チャンクPDFを元の順序で結合
+            writer = PdfWriter()
+            for chunk_path, count in zip(chunk_paths, counts):
+                if count > 0:
+                    writer.append(chunk_path)
+            if hasattr(self.output_path, 'write'):
+                writer.write(self.output_path)
+            else:
+                with open(self.output_path, 'wb') as f:
+                    writer.write(f)
+
+        total_generated = sum(counts)
+        if hasattr(self.output_path, 'write'):
+            print(f"✅ PDFを生成しました（並列ワーカー数: {n_workers}）")
+        else:
+            print(f"✅ PDFを生成しました: {self.output_path}（並列ワーカー数: {n_workers}）")
+        print(f"   生成枚数: {total_generated}枚")
+        return total_generated
+
+    def _valid_mask(self) -> pd.Series:
+        """
+        有効行（郵便番号あり・住所あり・国内）のブールマスクを返す
+
+        Returns:
+            pd.Series: 有効行がTrueのブールマスク
+        """
+        return (
+            self.df['郵便番号'].notna()
+            & (self.df['住所_整形済み'] != '')
+            & ~self.df['国外住所フラグ']
+        )
+
+    def _render(self, pdf: canvas.Canvas) -> int:
+        """
+        全ラベルをキャンバスに描画する
+
+        Args:
+            pdf: reportlabのCanvasオブジェクト
+
+        Returns:
+            int: 描画したラベル枚数
+        """
+        geometry = self._LABEL_GEOMETRY
+
+        # 各ラベルで共通の「〒 」プレフィックスは毎ページ描き直さず、
+        # 1つのForm XObjectとして事前描画してページごとにスタンプする
+        # （固定部分がPDF内で1オブジェクトになり、ストリームが小さくなる）
+        prefix_width = pdfmetrics.stringWidth(self._POSTAL_PREFIX, self.font_name, 11)
+        pdf.beginForm(self._POSTAL_PREFIX_FORM)
+        text = pdf.beginText()
+        text.setFont(self.font_name, 11)
+        for text_x, postal_y, _, _ in geometry:
+            text.setTextOrigin(text_x, postal_y)
+            text.textOut(self._POSTAL_PREFIX)
+        pdf.drawText(text)
+        pdf.endForm()
+
+        # 有効行（郵便番号あり・住所あり・国内）をベクトル演算で一括判定し、
+        # ループでは有効行のみを走査する（ReportGeneratorの有効件数と同じ条件）
+        valid = self.df.loc[self._valid_mask()]
+
+        # 必要カラムをndarrayとして一括で取り出しておく
+        # （ループ内での行ごとのpandasルックアップを避ける）
+        postals = valid['郵便番号'].to_numpy()
+        addresses = valid['住所_整形済み'].to_numpy()
+        names = valid['氏名_整形済み'].to_numpy()
+
+        # 住所の行分割はデータ並列なので、描画ループの前に全行分を済ませる
+        address_lines_all = self._split_addresses(addresses, max_length=25)
+
+        # 宛名データを10枚（1ページ）ずつバッチにまとめて描画する
+        # 進捗表示はページ境界でのみ行い、行ごとのカウンタ演算を避ける
+        page_batch = []
+        pages_drawn = 0
+        total_generated = 0
+
+        for postal, address_lines, name in zip(postals, address_lines_all, names):
+            # 配置位置の事前計算済み座標を取得してバッチに追加
+            text_x, postal_y, addr_y0, name_floor = geometry[len(page_batch)]
+            page_batch.append(
+                (text_x, postal_y, addr_y0, name_floor, postal, address_lines, name)
+            )
             total_generated += 1
 
-            # 10枚ごとに次のページへ
-            if page_count % 10 == 0:
+            # 10枚そろったらページを描画
+            if len(page_batch) == 10:
+                self._draw_page(pdf, page_batch, prefix_width)
                 pdf.showPage()
+                page_batch = []
+
+                pages_drawn += 1
+                if pages_drawn % self._PROGRESS_PAGE_INTERVAL == 0:
+                    print(f"   処理中... {total_generated}枚を描画済み")
 
-        # 最後のページを保存
-        if page_count % 10 != 0:  # 最後のページが途中で終わっている場合
+        # 最後のページが途中で終わっている場合
+        if page_batch:
+            self._draw_page(pdf, page_batch, prefix_width)
             pdf.showPage()
 
-        pdf.save()
-        print(f"✅ PDFを生成しました: {self.output_path}")
-        print(f"   生成枚数: {total_generated}枚")
+        return total_generated
 
-    def _draw_label(self, pdf: canvas.Canvas, x: float, y: float, row: pd.Series,
-                    label_width: float, label_height: float):
+    def _draw_page(self, pdf: canvas.Canvas, labels: list, prefix_width: float):
         """
-        1枚の宛名ラベルを描画
+        1ページ分（最大10枚）の宛名ラベルを描画
+
+        setFontはフォント辞書の再解決とPDFオペレータの出力を伴うため、
+        ラベルごとではなくフォントサイズごとにまとめて描画する
+        （ページあたり30回 → 3回のsetFont呼び出しになる）。
+        座標は_LABEL_GEOMETRYで事前計算済みのものをそのまま使う。
 
         Args:
             pdf: reportlabのCanvasオブジェクト
-            x: X座標
-            y: Y座標
-            row: データフレームの1行
-            label_width: ラベルの幅
-            label_height: ラベルの高さ
-        """
-        # デバッグ用の枠線を描画（オプション）
-        # pdf.rect(x, y, label_width, label_height)
-
-        # 郵便番号
-        pdf.setFont(self.font_name, 11)
-        postal_text = f"〒 {row['郵便番号']}"
-        pdf.drawString(x + 10, y + label_height - 30, postal_text)
-
-        # 住所（複数行に分割）
-        address_lines = self._split_address(row['住所_整形済み'], max_length=25)
-        pdf.setFont(self.font_name, 10)
-        for i, line in enumerate(address_lines):
-            pdf.drawString(x + 10, y + label_height - 50 - (i * 14), line)
-
-        # 氏名
-        pdf.setFont(self.font_name, 12)
-        name_y = y + label_height - 50 - (len(address_lines) * 14) - 20
-        # 最低位置を確保
-        if name_y < y + 10:
-            name_y = y + 10
-        pdf.drawString(x + 10, name_y, row['氏名_整形済み'])
+            labels: (テキストx, 郵便番号y, 住所1行目y, 氏名の下限y,
+                     郵便番号, 分割済み住所行リスト, 氏名) のタプルのリスト
+            prefix_width: 「〒 」プレフィックスの描画幅
+        """
+        # 10枚そろったページでは「〒 」プレフィックスをFormのスタンプで済ませる
+        # （端数ページではラベルのない面に〒が残らないよう個別に描画する）
+        full_page = len(labels) == 10
+        if full_page:
+            pdf.doForm(self._POSTAL_PREFIX_FORM)
+
+        # drawStringは呼び出しごとにBT/ETブロックを出力するため、
+        # フォントサイズごとに1つのtextObjectへまとめて描画する
+        # （コンテンツストリームが小さくなり、save()も速くなる）
+
+        # 郵便番号（フォントサイズ11）
+        text = pdf.beginText()
+        text.setFont(self.font_name, 11)
+        for text_x, postal_y, _, _, postal, _, _ in labels:
+            if full_page:
+                text.setTextOrigin(text_x + prefix_width, postal_y)
+                text.textOut(postal)
+            else:
+                text.setTextOrigin(text_x, postal_y)
+                text.textOut(f"{self._POSTAL_PREFIX}{postal}")
+        pdf.drawText(text)
+
+        # 住所（フォントサイズ10、複数行に分割）
+        text = pdf.beginText()
+        text.setFont(self.font_name, 10)
+        for text_x, _, addr_y0, _, _, address_lines, _ in labels:
+            for i, line in enumerate(address_lines):
+                text.setTextOrigin(text_x, addr_y0 - (i * 14))
+                text.textOut(line)
+        pdf.drawText(text)
+
+        # 氏名（フォントサイズ12）
+        text = pdf.beginText()
+        text.setFont(self.font_name, 12)
+        for text_x, _, addr_y0, name_floor, _, address_lines, name in labels:
+            name_y = addr_y0 - (len(address_lines) * 14) - 20
+            # 最低位置を確保
+            if name_y < name_floor:
+                name_y = name_floor
+            text.setTextOrigin(text_x, name_y)
+            text.textOut(name)
+        pdf.drawText(text)
+
+    def _split_addresses(self, addresses, max_length: int = 25) -> list:
+        """
+        住所カラム全体を複数行に分割する
+
+        Numbaが利用可能で行数が多い場合は、全住所を連結した文字列に対して
+        JITコンパイルしたカーネルで分割位置を並列計算し、Python側では
+        計算済みのインデックスでスライスするだけにする。
+
+        Args:
+            addresses: 住所文字列のndarray
+            max_length: 1行の最大文字数
+
+        Returns:
+            list: 行ごとの分割済み住所リストのリスト
+        """
+        if not (_HAS_NUMBA and len(addresses) >= _NUMBA_MIN_ROWS):
+            return [
+                self._split_address(address, max_length=max_length)
+                for address in addresses
+            ]
+
+        # 連結文字列とコードポイント単位のオフセットを用意する
+        # （Pythonのstrスライスはコードポイント単位なので、そのまま使える）
+        texts = list(addresses)
+        lengths = np.fromiter(
+            (len(s) for s in texts), dtype=np.int64, count=len(texts)
+        )
+        offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        concat = ''.join(texts)
+
+        # 行数は切り上げ除算で先に確定させる（空住所は1行 = ['']）
+        n_lines = np.maximum(1, -(-lengths // max_length))
+        line_offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+        np.cumsum(n_lines, out=line_offsets[1:])
+
+        line_starts = np.zeros(line_offsets[-1], dtype=np.int64)
+        line_ends = np.zeros(line_offsets[-1], dtype=np.int64)
+        _fill_address_line_breaks(offsets, line_offsets, max_length,
+                                  line_starts, line_ends)
+
+        return [
+            [concat[line_starts[k]:line_ends[k]]
+             for k in range(line_offsets[i], line_offsets[i + 1])]
+            for i in range(len(texts))
+        ]
 
     def _split_address(self, address: str, max_length: int = 25) -> list:
         """
@@ -166,19 +497,9 @@ class PDFGenerator:
         Returns:
             list: 分割された住所のリスト
         """
-        if not address or address == '':
+        if not address:
             return ['']
 
-        lines = []
-        current_line = ""
-
-        for char in address:
-            current_line += char
-            if len(current_line) >= max_length:
-                lines.append(current_line)
-                current_line = ""
-
-        if current_line:
-            lines.append(current_line)
-
-        return lines if lines else ['']
+        # 固定幅の分割なので、1文字ずつの連結ではなくスライスで切り出す
+        return [address[i:i + max_length]
+                for i in range(0, len(address), max_length)]
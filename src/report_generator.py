@@ -12,105 +12,134 @@ class ReportGenerator:
     データ品質レポートを生成するクラス
     """
 
-    def __init__(self, df: pd.DataFrame, errors: list, output_path: str):
+    # レポート全体のテンプレート
+    # 逐次appendで組み立てる代わりに、スカラー値を先に計算して一括で埋め込む
+    _TEMPLATE = """{bar}
+POSSIM ハガキ宛名印刷 データ品質レポート
+{bar}
+
+生成日時: {now}
+
+【総件数】: {total_count}件
+
+【有効件数】: {valid_count}件
+
+【除外件数】: {excluded_count}件
+
+{error_section}{priority_section}【データ品質サマリー】:
+  郵便番号欠損率: {postal_missing_rate:.1f}%
+  国外住所率: {foreign_rate:.1f}%
+  重複住所率: {duplicate_rate:.1f}%
+
+【処理結果サマリー】:
+  宛名ラベル生成数: {valid_count}枚
+  成功率: {success_rate:.1f}%
+
+{bar}
+処理完了
+{bar}"""
+
+    def __init__(self, df: pd.DataFrame, errors: list, output_path,
+                 verbose: bool = False):
         """
         コンストラクタ
 
         Args:
             df (pd.DataFrame): クレンジング済みデータフレーム
             errors (list): エラーリスト
-            output_path (str): 出力テキストファイルパス
+            output_path (str or file-like): 出力テキストファイルパス、または
+                書き込み可能なバイナリファイルオブジェクト
+            verbose (bool): Trueの場合、レポート全文を標準出力にも表示する
         """
         self.df = df
         self.errors = errors
         self.output_path = output_path
+        self.verbose = verbose
 
     def generate(self):
         """レポートを生成"""
-        report_lines = []
-
-        # ヘッダー
-        report_lines.append("=" * 70)
-        report_lines.append("POSSIM ハガキ宛名印刷 データ品質レポート")
-        report_lines.append("=" * 70)
-        report_lines.append("")
-        report_lines.append(f"生成日時: {datetime.now().strftime('%Y年%m月%d日 %H:%M:%S')}")
-        report_lines.append("")
-
         # 総件数
         total_count = len(self.df)
-        report_lines.append(f"【総件数】: {total_count}件")
-        report_lines.append("")
+
+        # 0件の場合は比率計算（ゼロ除算）ができないため、レポートを出力しない
+        if total_count == 0:
+            print("⚠ 警告: データが0件のため、レポートの生成をスキップしました")
+            return
 
         # 有効件数（郵便番号あり、住所あり、国外住所でない）
-        valid_count = len(self.df[
-            ~self.df['郵便番号'].isna() &
-            (self.df['住所_整形済み'] != '') &
-            ~self.df['国外住所フラグ']
-        ])
-        report_lines.append(f"【有効件数】: {valid_count}件")
-        report_lines.append("")
-
-        # 除外件数
-        excluded_count = total_count - valid_count
-        report_lines.append(f"【除外件数】: {excluded_count}件")
-        report_lines.append("")
+        # マスクは優先度別の集計でも使うため、1回だけ計算する
+        valid_mask = (
+            self.df['郵便番号'].notna()
+            & (self.df['住所_整形済み'] != '')
+            & ~self.df['国外住所フラグ']
+        )
+        valid_count = int(valid_mask.sum())
 
         # エラー内容
+        error_section = ''
         if self.errors:
-            report_lines.append("【エラー・警告内容】:")
-            for error in self.errors:
-                report_lines.append(f"  - {error}")
-            report_lines.append("")
+            error_lines = ''.join(f"  - {error}\n" for error in self.errors)
+            error_section = f"【エラー・警告内容】:\n{error_lines}\n"
 
         # 優先度別の集計
+        priority_section = ''
         if '優先順位' in self.df.columns:
-            report_lines.append("【優先度別の件数】:")
-            priority_counts = self.df['優先順位'].value_counts().sort_index()
-            for priority, count in priority_counts.items():
-                # 有効件数も表示
-                valid_priority_count = len(self.df[
-                    (self.df['優先順位'] == priority) &
-                    ~self.df['郵便番号'].isna() &
-                    (self.df['住所_整形済み'] != '') &
-                    ~self.df['国外住所フラグ']
-                ])
-                report_lines.append(f"  優先順位{priority}: {count}件 （有効: {valid_priority_count}件）")
-            report_lines.append("")
-
-        # データ品質サマリー
-        report_lines.append("【データ品質サマリー】:")
-
-        # 郵便番号欠損率
-        postal_missing_rate = (self.df['郵便番号'].isna().sum() / total_count) * 100
-        report_lines.append(f"  郵便番号欠損率: {postal_missing_rate:.1f}%")
-
-        # 国外住所率
-        foreign_rate = (self.df['国外住所フラグ'].sum() / total_count) * 100
-        report_lines.append(f"  国外住所率: {foreign_rate:.1f}%")
-
-        # 重複住所率
-        duplicate_rate = (self.df['重複住所フラグ'].sum() / total_count) * 100
-        report_lines.append(f"  重複住所率: {duplicate_rate:.1f}%")
-
-        report_lines.append("")
-
-        # 処理結果サマリー
-        report_lines.append("【処理結果サマリー】:")
-        report_lines.append(f"  宛名ラベル生成数: {valid_count}枚")
-        report_lines.append(f"  成功率: {(valid_count / total_count) * 100:.1f}%")
-        report_lines.append("")
-
-        # フッター
-        report_lines.append("=" * 70)
-        report_lines.append("処理完了")
-        report_lines.append("=" * 70)
+            # 総件数と有効件数を1回のgroupbyでまとめて集計する
+            # （優先度ごとのマスク再計算やvalue_countsの2重スキャンを避ける）
+            priority_agg = (
+                pd.DataFrame({
+                    '優先順位': self.df['優先順位'],
+                    '有効': valid_mask,
+                })
+                .groupby('優先順位')
+                .agg(total=('有効', 'size'), valid=('有効', 'sum'))
+                .sort_index()
+            )
+            priority_lines = [
+                f"  優先順位{priority}: {total}件 （有効: {valid}件）\n"
+                for priority, total, valid in priority_agg.itertuples()
+            ]
+            priority_section = f"【優先度別の件数】:\n{''.join(priority_lines)}\n"
+
+        # 品質サマリーの統計量は1回のaggでまとめて集計する
+        # （カラムごとのsum/isnaの個別スキャンを避ける）
+        stats = self.df.agg({
+            '郵便番号': 'count',
+            '国外住所フラグ': 'sum',
+            '重複住所フラグ': 'sum',
+        })
+        postal_missing_count = total_count - int(stats['郵便番号'])
+
+        # テンプレートに一括で埋め込む
+        report_text = self._TEMPLATE.format(
+            bar="=" * 70,
+            now=datetime.now().strftime('%Y年%m月%d日 %H:%M:%S'),
+            total_count=total_count,
+            valid_count=valid_count,
+            excluded_count=total_count - valid_count,
+            error_section=error_section,
+            priority_section=priority_section,
+            postal_missing_rate=(postal_missing_count / total_count) * 100,
+            foreign_rate=(int(stats['国外住所フラグ']) / total_count) * 100,
+            duplicate_rate=(int(stats['重複住所フラグ']) / total_count) * 100,
+            success_rate=(valid_count / total_count) * 100,
+        )
 
         # レポートを出力
-        report_text = "\n".join(report_lines)
-        with open(self.output_path, 'w', encoding='utf-8') as f:
-            f.write(report_text)
-
-        print(f"✅ レポートを生成しました: {self.output_path}")
-        print("")
-        print(report_text)
+        # テキストモードの逐次エンコードを避け、一度だけエンコードして
+        # 大きめのバッファでバイナリ書き込みする
+        encoded = report_text.encode('utf-8')
+        if hasattr(self.output_path, 'write'):
+            # 開いたままのファイルオブジェクト（パイプやBytesIO等）に直接書き込む
+            self.output_path.write(encoded)
+            print("✅ レポートを生成しました")
+        else:
+            with open(self.output_path, 'wb', buffering=1 << 20) as f:
+                f.write(encoded)
+            print(f"✅ レポートを生成しました: {self.output_path}")
+
+        # レポート全文の端末出力はディスク書き込みより遅いことがあるため、
+        # verbose指定時のみ表示する（内容はファイルで確認できる）
+        if self.verbose:
+            print("")
+            print(report_text)
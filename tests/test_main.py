@@ -17,10 +17,14 @@ from data_cleaner import DataCleaner
 class TestDataCleaner(unittest.TestCase):
     """DataCleanerクラスのテスト"""
 
-    def setUp(self):
-        """テスト前の準備"""
-        # サンプルデータを作成
-        self.sample_data = pd.DataFrame({
+    @classmethod
+    def setUpClass(cls):
+        """テストクラス全体で共有する準備
+
+        DataCleanerはCopy-on-Writeにより入力フレームを変更しないため、
+        サンプルデータはテストごとに作り直さず1回だけ構築して共有する。
+        """
+        cls.sample_data = pd.DataFrame({
             '優先順位': [1, 2, 3, 1],
             '氏名': ['木邑敏章', '正司宣彦', '後藤由起子', 'John Doe'],
             '郵便番号': ['2300025', '618-0011', 'ABC123', '1234567'],
@@ -127,22 +131,34 @@ class TestDataCleaner(unittest.TestCase):
 class TestAddressSplitting(unittest.TestCase):
     """住所分割機能のテスト"""
 
-    def test_split_long_address(self):
-        """長い住所が正しく分割されるかテスト"""
-        from pdf_generator import PDFGenerator
+    @classmethod
+    def setUpClass(cls):
+        """テストクラス全体で共有する準備
 
-        # ダミーのデータフレームを作成
-        dummy_df = pd.DataFrame({
-            '郵便番号': ['123-4567'],
-            '住所_整形済み': ['東京都千代田区霞が関1-2-3 中央合同庁舎第5号館10階'],
-            '氏名_整形済み': ['山田太郎 様'],
-            '国外住所フラグ': [False]
-        })
+        分割処理はフォントを使わないため、_register_fontを差し替えて
+        フォント探索（ファイルシステムアクセス）を省いたインスタンスを
+        1回だけ構築して共有する。
+        """
+        from pdf_generator import PDFGenerator
 
-        pdf_gen = PDFGenerator(dummy_df, 'dummy.pdf')
+        cls._orig_register_font = PDFGenerator._register_font
+        PDFGenerator._register_font = lambda self: 'Courier'
+        try:
+            # ダミーのデータフレームを作成
+            dummy_df = pd.DataFrame({
+                '郵便番号': ['123-4567'],
+                '住所_整形済み': ['東京都千代田区霞が関1-2-3 中央合同庁舎第5号館10階'],
+                '氏名_整形済み': ['山田太郎 様'],
+                '国外住所フラグ': [False]
+            })
+            cls.pdf_gen = PDFGenerator(dummy_df, 'dummy.pdf')
+        finally:
+            PDFGenerator._register_font = cls._orig_register_font
 
+    def test_split_long_address(self):
+        """長い住所が正しく分割されるかテスト"""
         # 住所を分割
-        lines = pdf_gen._split_address('東京都千代田区霞が関1-2-3 中央合同庁舎第5号館10階', max_length=20)
+        lines = self.pdf_gen._split_address('東京都千代田区霞が関1-2-3 中央合同庁舎第5号館10階', max_length=20)
 
         # 複数行に分割されているか確認
         self.assertGreater(len(lines), 1)